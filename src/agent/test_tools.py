@@ -0,0 +1,107 @@
+import re
+import pytest
+from agent.tools import (
+    _compile_expression,
+    _compile_scalar,
+    _evaluate_numexpr,
+    _evaluate_scalar,
+    _parse_expression,
+    _strip_brackets,
+    calculator_func,
+)
+
+PARITY_EXPRESSIONS = [
+    "37593 * 67",
+    "2*pi",
+    "sqrt(16) + e",
+    "7/2",
+    "1/3",
+    "-3 % 2",
+    "-3.5 % 2",
+    "abs(-3)",
+    "abs(-3.5)",
+    "sin(pi/2)",
+    "arctan2(1, 1)",
+    "log10(1000)",
+    "sqrt(-1)",
+    "log(-1)",
+    "log(0)",
+    "arccosh(0.5)",
+    "exp(1000)",
+    "1/(pi-pi)",
+    "5 % (pi-pi)",
+    "3037000500*3037000500",
+    "3037000500*3037000500*pi",
+]
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_scalar_fast_path_matches_numexpr():
+    for expression in PARITY_EXPRESSIONS:
+        code = _compile_scalar(expression)
+        assert code is not None, expression
+        output = _evaluate_scalar(code)
+        if output is not None:
+            assert output == _evaluate_numexpr(expression), expression
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_scalar_fast_path_defers_to_numexpr():
+    assert calculator_func("sqrt(-1)") == "nan"
+    assert calculator_func("log(0)") == "-inf"
+    assert calculator_func("arccosh(0.5)") == "nan"
+    assert calculator_func("exp(1000)") == "inf"
+    assert calculator_func("1/(pi-pi)") == "inf"
+    # math.log accepts a base argument, numexpr's log does not
+    assert _compile_scalar("log(8, 2)") is None
+    with pytest.raises(ValueError):
+        calculator_func("log(8, 2)")
+    # numexpr works in int64, so big integer results are not returned exactly
+    with pytest.raises(ValueError):
+        calculator_func("3037000500*3037000500")
+
+
+def test_parse_expression_rejects_non_math_input():
+    rejected = {
+        "(1).__class__": "unsupported syntax Attribute",
+        "pi.real": "unsupported syntax Attribute",
+        "[1, 2][0]": "unsupported syntax Subscript",
+        "[1, 2]": "unsupported syntax List",
+        "lambda: 1": "unsupported syntax Lambda",
+        "'a' + 'b'": "unsupported constant 'a'",
+        "x + 1": "unknown name 'x'",
+        '__import__("os")': "unsupported function call __import__",
+        "sqrt(x=4)": "unsupported function call sqrt",
+        "contains('a', 'b')": "unsupported function call contains",
+    }
+    for expression, message in rejected.items():
+        with pytest.raises(ValueError, match=re.escape(message)):
+            _parse_expression(expression)
+        with pytest.raises(ValueError):
+            calculator_func(expression)
+
+
+def test_compiled_expression_cache():
+    _compile_expression.cache_clear()
+    assert calculator_func("2**3 * pi") == calculator_func("2**3 * pi")
+    assert _compile_expression.cache_info().hits == 1
+
+
+def test_strip_brackets():
+    assert _strip_brackets("[1 2 3]") == "1 2 3"
+    assert _strip_brackets("[[1]]") == "[1]"
+    assert _strip_brackets("1.5") == "1.5"
+
+
+def test_calculator_results():
+    assert calculator_func("37593 * 67") == "2518731"
+    assert calculator_func(" sqrt(16) + e ") == "6.718281828459045"
+    assert calculator_func("7/2") == "3.5"
+    assert calculator_func("-18 % 5") == "2"
+    assert calculator_func("arctan2(1, 1)") == "0.7853981633974483"
+    assert calculator_func("2**10") == "1024"
+    assert calculator_func("2 ** 0.5") == "1.4142135623730951"
+    assert calculator_func("(1+2j)*(3-1j)") == "(5+5j)"
+    assert calculator_func("where(pi > 3, 1, 0)") == "1"
+    assert calculator_func("where(1 > 2, 10.5, 20.5)") == "20.5"
+    assert calculator_func("3 > 2") == "True"
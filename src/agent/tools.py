@@ -1,8 +1,189 @@
+import ast
 import math
 import numexpr
-import re
+import numpy as np
+from functools import lru_cache
+from types import CodeType
+
+# numexpr.evaluate serializes calls with this module-level lock. It is not public API,
+# but it is stable across the numexpr ~=2.10.1 pin and sharing it is the only way to
+# keep NumExpr objects from running concurrently with evaluate() elsewhere.
+from numexpr.necompiler import evaluate_lock
 from langchain_core.tools import tool, BaseTool
 
+# Common mathematical constants available to calculator expressions.
+_CONSTANTS = {"pi": math.pi, "e": math.e}
+
+# Scalar equivalents of the numexpr functions, for the plain Python fast path.
+# They take the same number of arguments as numexpr: math.log is only ever called
+# with one, since its optional base argument has no numexpr counterpart.
+_UNARY_FUNCTIONS = {
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "arcsin": math.asin,
+    "arccos": math.acos,
+    "arctan": math.atan,
+    "sinh": math.sinh,
+    "cosh": math.cosh,
+    "tanh": math.tanh,
+    "arcsinh": math.asinh,
+    "arccosh": math.acosh,
+    "arctanh": math.atanh,
+    "log": math.log,
+    "log10": math.log10,
+    "log1p": math.log1p,
+    "exp": math.exp,
+    "expm1": math.expm1,
+    "sqrt": math.sqrt,
+    "abs": abs,
+}
+_BINARY_FUNCTIONS = {"arctan2": math.atan2}
+
+_SCALAR_NAMESPACE = {**_CONSTANTS, **_UNARY_FUNCTIONS, **_BINARY_FUNCTIONS}
+
+# numexpr evaluates integer expressions in int64 and rejects results outside it.
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+# Math functions supported by numexpr. Its array helpers (copy, ones_like) and string
+# function (contains) are out of scope for a calculator and are left out.
+_NUMEXPR_FUNCTIONS = frozenset(
+    {
+        *_UNARY_FUNCTIONS,
+        *_BINARY_FUNCTIONS,
+        "where",
+        "fmod",
+        "ceil",
+        "floor",
+        "real",
+        "imag",
+        "complex",
+        "conj",
+        "sum",
+        "prod",
+        "min",
+        "max",
+    }
+)
+
+# Syntax that can appear in a numexpr math expression. Anything else, such as
+# attribute access, subscripts or lambdas, is rejected before compiling.
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+    ast.Call,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.operator,
+    ast.unaryop,
+    ast.cmpop,
+)
+
+
+def _validate_expression(tree: ast.Expression) -> None:
+    """Raise ValueError if a parsed expression contains anything but math."""
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"unsupported syntax {node.__class__.__name__}")
+        match node:
+            case ast.Constant(value=value) if type(value) not in (int, float, complex, bool):
+                raise ValueError(f"unsupported constant {value!r}")
+            case ast.Call(func=ast.Name(id=name), keywords=[]) if name in _NUMEXPR_FUNCTIONS:
+                pass
+            case ast.Call():
+                raise ValueError(f"unsupported function call {ast.unparse(node.func)}")
+            case ast.Name(id=name) if name not in _CONSTANTS and name not in _NUMEXPR_FUNCTIONS:
+                raise ValueError(f"unknown name {name!r}")
+
+
+@lru_cache(maxsize=512)
+def _parse_expression(expression: str) -> ast.Expression:
+    """Parse and validate a math expression, failing fast on non-math input."""
+    tree = ast.parse(expression, mode="eval")
+    _validate_expression(tree)
+    return tree
+
+
+def _is_scalar_expression(node: ast.AST) -> bool:
+    """Check that an expression only uses plain arithmetic on numbers, constants and functions.
+
+    Powers are left to numexpr, which evaluates them with bounded integer precision.
+    """
+    match node:
+        case ast.Constant(value=value):
+            return type(value) in (int, float)
+        case ast.Name(id=name):
+            return name in _CONSTANTS
+        case ast.UnaryOp(op=ast.UAdd() | ast.USub(), operand=operand):
+            return _is_scalar_expression(operand)
+        case ast.BinOp(op=ast.Add() | ast.Sub() | ast.Mult() | ast.Div() | ast.Mod()):
+            return _is_scalar_expression(node.left) and _is_scalar_expression(node.right)
+        case ast.Call(func=ast.Name(id=name), args=[arg], keywords=[]) if name in _UNARY_FUNCTIONS:
+            return _is_scalar_expression(arg)
+        case ast.Call(func=ast.Name(id=name), args=[x, y], keywords=[]) if (
+            name in _BINARY_FUNCTIONS
+        ):
+            return _is_scalar_expression(x) and _is_scalar_expression(y)
+        case _:
+            return False
+
+
+@lru_cache(maxsize=512)
+def _compile_scalar(expression: str) -> CodeType | None:
+    """Compile a scalar expression to Python bytecode, or return None if numexpr is needed.
+
+    Raises ValueError (or SyntaxError) for input that is not a math expression.
+    """
+    tree = _parse_expression(expression)
+    if not _is_scalar_expression(tree.body):
+        return None
+    return compile(tree, "<calculator>", "eval")
+
+
+@lru_cache(maxsize=512)
+def _compile_expression(expression: str) -> tuple[numexpr.NumExpr, tuple[str, ...]]:
+    """Compile a numexpr expression once and return it with its input variable names."""
+    tree = _parse_expression(expression)
+    # NumExpr requires the signature to list exactly the constants the expression uses.
+    names = tuple(
+        sorted({n.id for n in ast.walk(tree) if isinstance(n, ast.Name)} & _CONSTANTS.keys())
+    )
+    signature = [(name, np.double) for name in names]
+    return numexpr.NumExpr(expression, signature=signature), names
+
+
+def _evaluate_scalar(code: CodeType) -> str | None:
+    """Evaluate a compiled scalar expression, or return None to defer to numexpr."""
+    try:
+        result = eval(code, {"__builtins__": {}}, _SCALAR_NAMESPACE)
+    except (ArithmeticError, ValueError, TypeError):
+        # math raises where numexpr returns nan or inf, e.g. sqrt(-1), log(0) or exp(1000).
+        return None
+    if type(result) is int and not _INT64_MIN <= result <= _INT64_MAX:
+        return None
+    return str(result)
+
+
+def _strip_brackets(output: str) -> str:
+    """Strip the brackets numpy puts around array output."""
+    if output.startswith("["):
+        output = output[1:]
+    if output.endswith("]"):
+        output = output[:-1]
+    return output
+
+
+def _evaluate_numexpr(expression: str) -> str:
+    """Evaluate an expression with numexpr."""
+    compiled, names = _compile_expression(expression)
+    args = [_CONSTANTS[name] for name in names]
+    # numexpr's virtual machine is not re-entrant, so share numexpr.evaluate's lock
+    with evaluate_lock:
+        return _strip_brackets(str(compiled(*args)))
+
 
 def calculator_func(expression: str) -> str:
     """Calculates a math expression using numexpr.
@@ -19,15 +200,12 @@ def calculator_func(expression: str) -> str:
     """
 
     try:
-        local_dict = {"pi": math.pi, "e": math.e}
-        output = str(
-            numexpr.evaluate(
-                expression.strip(),
-                global_dict={},  # restrict access to globals
-                local_dict=local_dict,  # add common mathematical functions
-            )
-        )
-        return re.sub(r"^\[|\]$", "", output)
+        # Small scalar expressions are much cheaper to evaluate in plain Python
+        # than to run through the numexpr virtual machine.
+        if code := _compile_scalar(expression.strip()):
+            if (output := _evaluate_scalar(code)) is not None:
+                return output
+        return _evaluate_numexpr(expression.strip())
     except Exception as e:
         raise ValueError(
             f'calculator("{expression}") raised error: {e}.'
@@ -68,7 +68,7 @@ class ChatMessage(BaseModel):
     )
     tool_calls: List[ToolCall] = Field(
         description="Tool calls in the message.",
-        default=[],
+        default_factory=list,
     )
     tool_call_id: str | None = Field(
         description="Tool call that this message is responding to.",
@@ -82,32 +82,25 @@ class ChatMessage(BaseModel):
     )
     original: Dict[str, Any] = Field(
         description="Original LangChain message in serialized form.",
-        default={},
+        default_factory=dict,
     )
 
     @classmethod
     def from_langchain(cls, message: BaseMessage) -> "ChatMessage":
         """Create a ChatMessage from a LangChain message."""
-        original = message_to_dict(message)
-        match message:
-            case HumanMessage():
-                human_message = cls(type="human", content=message.content, original=original)
-                return human_message
-            case AIMessage():
-                ai_message = cls(type="ai", content=message.content, original=original)
-                if message.tool_calls:
-                    ai_message.tool_calls = message.tool_calls
-                return ai_message
-            case ToolMessage():
-                tool_message = cls(
-                    type="tool",
-                    content=message.content,
-                    tool_call_id=message.tool_call_id,
-                    original=original,
-                )
-                return tool_message
-            case _:
-                raise ValueError(f"Unsupported message type: {message.__class__.__name__}")
+        handler = _FROM_LANGCHAIN.get(type(message))
+        if handler is None:
+            # Subclasses such as AIMessageChunk resolve to their base message handler.
+            handler = next(
+                (_FROM_LANGCHAIN[t] for t in type(message).__mro__ if t in _FROM_LANGCHAIN),
+                None,
+            )
+        if handler is None:
+            raise ValueError(f"Unsupported message type: {message.__class__.__name__}")
+        # The handlers skip validation, so check content here, e.g. for content blocks.
+        if not isinstance(message.content, str):
+            raise ValueError(f"Unsupported message content: {message.content.__class__.__name__}")
+        return handler(cls, message, message_to_dict(message))
 
     def to_langchain(self) -> BaseMessage:
         """Convert the ChatMessage to a LangChain message."""
@@ -125,6 +118,55 @@ class ChatMessage(BaseModel):
         lc_msg.pretty_print()
 
 
+# The LangChain message has already been validated, so these skip pydantic validation
+# with model_construct and pass every field explicitly.
+def _from_human(
+    cls: type["ChatMessage"], message: HumanMessage, original: Dict[str, Any]
+) -> "ChatMessage":
+    return cls.model_construct(
+        type="human",
+        content=message.content,
+        tool_calls=[],
+        tool_call_id=None,
+        run_id=None,
+        original=original,
+    )
+
+
+def _from_ai(
+    cls: type["ChatMessage"], message: AIMessage, original: Dict[str, Any]
+) -> "ChatMessage":
+    return cls.model_construct(
+        type="ai",
+        content=message.content,
+        tool_calls=message.tool_calls or [],
+        tool_call_id=None,
+        run_id=None,
+        original=original,
+    )
+
+
+def _from_tool(
+    cls: type["ChatMessage"], message: ToolMessage, original: Dict[str, Any]
+) -> "ChatMessage":
+    return cls.model_construct(
+        type="tool",
+        content=message.content,
+        tool_calls=[],
+        tool_call_id=message.tool_call_id,
+        run_id=None,
+        original=original,
+    )
+
+
+# Dispatch table for ChatMessage.from_langchain, keyed on the LangChain message class.
+_FROM_LANGCHAIN = {
+    HumanMessage: _from_human,
+    AIMessage: _from_ai,
+    ToolMessage: _from_tool,
+}
+
+
 class Feedback(BaseModel):
     """Feedback for a run, to record to LangSmith."""
 
@@ -142,6 +184,6 @@ class Feedback(BaseModel):
     )
     kwargs: Dict[str, Any] = Field(
         description="Additional feedback kwargs, passed to LangSmith.",
-        default={},
+        default_factory=dict,
         examples=[{"comment": "In-line human feedback"}],
     )
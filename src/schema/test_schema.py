@@ -1,4 +1,12 @@
-from langchain_core.messages import HumanMessage, AIMessage, ToolMessage, SystemMessage, ToolCall
+import pytest
+from langchain_core.messages import (
+    HumanMessage,
+    AIMessage,
+    AIMessageChunk,
+    ToolMessage,
+    SystemMessage,
+    ToolCall,
+)
 from schema import ChatMessage
 
 
@@ -37,6 +45,19 @@ def test_messages_from_langchain():
         assert str(e) == "Unsupported message type: SystemMessage"
 
 
+def test_messages_from_langchain_subclass():
+    lc_ai_chunk = AIMessageChunk(content="Hello, world!")
+    ai_message = ChatMessage.from_langchain(lc_ai_chunk)
+    assert ai_message.type == "ai"
+    assert ai_message.content == "Hello, world!"
+
+
+def test_messages_from_langchain_content_blocks():
+    lc_ai_message = AIMessage(content=[{"type": "text", "text": "Hello, world!"}])
+    with pytest.raises(ValueError, match="Unsupported message content: list"):
+        ChatMessage.from_langchain(lc_ai_message)
+
+
 def test_message_run_id_usage():
     run_id = "847c6285-8fc9-4560-a83f-4e6285809254"
     lc_message = AIMessage(content="Hello, world!")
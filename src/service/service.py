@@ -108,7 +108,8 @@ async def message_generator(user_input: StreamInput) -> AsyncGenerator[str, None
                 # LangGraph re-sends the input message, which feels weird, so drop it
             if chat_message.type == "human" and chat_message.content == user_input.message:
                 continue
-            yield f"data: {json.dumps({'type': 'message', 'content': chat_message.dict()})}\n\n"
+            # Serialize with pydantic's Rust-backed JSON encoder rather than dict() + json.dumps.
+            yield f'data: {{"type": "message", "content": {chat_message.model_dump_json()}}}\n\n'
 
         # Yield tokens streamed from LLMs.
         if (
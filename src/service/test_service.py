@@ -1,4 +1,5 @@
-from langchain_core.messages import AIMessage
+import json
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolCall
 from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock
 
@@ -28,6 +29,53 @@ def test_invoke(mock_agent):
     assert output.content == ANSWER
 
 
+@patch("service.service.research_assistant")
+def test_stream(mock_agent):
+    QUESTION = "What is 3 * 4?"
+    tool_call = ToolCall(name="Calculator", args={"expression": "3 * 4"}, id="call_Jja7")
+    messages = [
+        AIMessage(content="", tool_calls=[tool_call]),
+        AIMessageChunk(content='Résultat: "12" ✓'),
+    ]
+    events = [
+        {"event": "on_chat_model_stream", "tags": [], "data": {"chunk": messages[1]}},
+        {
+            "event": "on_chain_end",
+            "tags": ["graph:step:1"],
+            "data": {"output": {"messages": messages[:1]}},
+        },
+        {
+            "event": "on_chain_end",
+            "tags": ["graph:step:2"],
+            "data": {"output": {"messages": messages[1:]}},
+        },
+    ]
+
+    async def astream_events(**kwargs):
+        for event in events:
+            yield event
+
+    mock_agent.astream_events = astream_events
+
+    with client as c:
+        response = c.post("/stream", json={"message": QUESTION})
+        assert response.status_code == 200
+
+    lines = [line for line in response.text.split("\n\n") if line]
+    assert all(line.startswith("data: ") for line in lines)
+    assert lines[-1] == "data: [DONE]"
+    parsed = [json.loads(line[6:]) for line in lines[:-1]]
+
+    assert parsed[0] == {"type": "token", "content": messages[1].content}
+    assert [event["type"] for event in parsed[1:]] == ["message", "message"]
+    for event, message in zip(parsed[1:], messages):
+        expected = ChatMessage.from_langchain(message)
+        expected.run_id = event["content"]["run_id"]
+        assert event["content"] == json.loads(json.dumps(expected.model_dump()))
+    assert parsed[1]["content"]["tool_calls"][0]["id"] == "call_Jja7"
+    assert parsed[2]["content"]["content"] == 'Résultat: "12" ✓'
+
+
 @patch("service.service.LangsmithClient")
 def test_feedback(mock_client):
     ls_instance = mock_client.return_value